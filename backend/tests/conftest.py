@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+# app.py reads these at import time. The database URL points at a closed port so
+# the pool is never created; tests that need the database replace db() instead.
+os.environ.setdefault('SECRET_KEY', 'test-secret-key-that-is-long-enough-for-hs256')
+os.environ.setdefault('DATABASE_URL', 'postgresql://127.0.0.1:1/mcqweb_test')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def backend():
+    return app_module
+
+
+@pytest.fixture
+def client():
+    app_module.app.config['TESTING'] = True
+    return app_module.app.test_client()
@@ -0,0 +1,42 @@
+import time
+
+import jwt
+
+
+def test_create_token_round_trips_through_pyjwt(backend):
+    token = backend.create_token(42)
+
+    payload = jwt.decode(token, backend.SECRET_KEY, algorithms=['HS256'])
+    assert payload['user_id'] == 42
+    assert 0 < payload['exp'] - time.time() <= backend.TOKEN_TTL_SECONDS
+    assert jwt.get_unverified_header(token) == {'alg': 'HS256', 'typ': 'JWT'}
+
+
+def test_create_token_honours_ttl(backend):
+    token = backend.create_token(7, ttl=60)
+
+    payload = jwt.decode(token, backend.SECRET_KEY, algorithms=['HS256'])
+    assert 0 < payload['exp'] - time.time() <= 60
+
+
+def test_create_token_is_rejected_with_another_key(backend):
+    token = backend.create_token(1)
+
+    try:
+        jwt.decode(token, 'some-other-secret-key-of-sufficient-length', algorithms=['HS256'])
+    except jwt.InvalidSignatureError:
+        pass
+    else:
+        raise AssertionError("token verified with the wrong key")
+
+
+def test_token_required_accepts_created_token(client, backend):
+    # my-results needs the database; with it unavailable the auth check still has to pass first
+    response = client.get('/api/my-results', headers={'Authorization': 'Bearer ' + backend.create_token(5)})
+    assert response.status_code == 503
+
+
+def test_token_required_rejects_tampered_token(client, backend):
+    token = backend.create_token(5)
+    response = client.get('/api/my-results', headers={'Authorization': 'Bearer ' + token[:-2] + 'xx'})
+    assert response.status_code == 401
@@ -0,0 +1,144 @@
+import queue
+from contextlib import contextmanager
+
+import pytest
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.cur = FakeCursor(rows)
+
+    def cursor(self, **kwargs):
+        return self.cur
+
+
+def answer_key(n, already_submitted=False):
+    """Rows as returned by the answer_key statement: question i's correct answer is 'A'."""
+    return [{'id': i, 'correct_option': 'A', 'already_submitted': already_submitted} for i in range(1, n + 1)]
+
+
+@pytest.fixture
+def submit(client, backend, monkeypatch):
+    """Posts to /api/exams/submit as user 5, with the answer key query returning `rows`."""
+    results = queue.Queue()
+    monkeypatch.setattr(backend, '_RESULT_QUEUE', results)
+    monkeypatch.setattr(backend, 'USE_PREPARED_STATEMENTS', False)
+    headers = {'Authorization': 'Bearer ' + backend.create_token(5)}
+
+    def post(body, rows):
+        conn = FakeConnection(rows)
+
+        @contextmanager
+        def fake_db():
+            yield conn
+
+        monkeypatch.setattr(backend, 'db', fake_db)
+        response = client.post('/api/exams/submit', json=body, headers=headers)
+        response.executed = conn.cur.executed
+        response.queued = list(results.queue)
+        return response
+
+    return post
+
+
+def test_scores_against_the_whole_set(submit):
+    answers = [{'question_id': 1, 'answer': 'A'}, {'question_id': 2, 'answer': 'B'}]
+
+    response = submit({'set_id': 3, 'answers': answers}, answer_key(10))
+
+    assert response.status_code == 200
+    assert response.json['score'] == 1
+    assert response.json['total_marks'] == 10
+    assert response.queued == [(5, 3, 1, 10)]
+    assert response.executed[0][1] == (5, 3)
+
+
+def test_only_reveals_answers_that_were_submitted(submit):
+    response = submit({'set_id': 3, 'answers': [{'question_id': 2, 'answer': 'C'}]}, answer_key(10))
+
+    assert response.json['correct_answers'] == {'2': 'A'}
+
+
+def test_empty_submission_reveals_nothing(submit):
+    response = submit({'set_id': 3, 'answers': []}, answer_key(10))
+
+    assert response.status_code == 200
+    assert response.json['score'] == 0
+    assert response.json['correct_answers'] == {}
+
+
+def test_ignores_questions_from_other_sets(submit):
+    response = submit({'set_id': 3, 'answers': [{'question_id': 99, 'answer': 'A'}]}, answer_key(10))
+
+    assert response.json['score'] == 0
+    assert response.json['correct_answers'] == {}
+
+
+def test_hard_mode_total_is_the_sample_size(submit):
+    answers = [{'question_id': i, 'answer': 'A'} for i in range(1, 31)]
+
+    response = submit({'set_id': 3, 'hard': True, 'answers': answers}, answer_key(40))
+
+    assert response.status_code == 200
+    assert response.json['score'] == 30
+    assert response.json['total_marks'] == 30
+
+
+def test_hard_mode_rejects_more_answers_than_served(submit):
+    answers = [{'question_id': i, 'answer': 'A'} for i in range(1, 32)]
+
+    response = submit({'set_id': 3, 'hard': True, 'answers': answers}, answer_key(40))
+
+    assert response.status_code == 400
+    assert response.queued == []
+
+
+def test_set_that_is_not_live_is_404(submit):
+    response = submit({'set_id': 3, 'answers': []}, [])
+
+    assert response.status_code == 404
+    assert response.queued == []
+
+
+def test_repeat_submission_is_409(submit):
+    response = submit({'set_id': 3, 'answers': [{'question_id': 1, 'answer': 'A'}]}, answer_key(10, True))
+
+    assert response.status_code == 409
+    assert response.queued == []
+
+
+@pytest.mark.parametrize('body', [
+    {'answers': []},
+    {'set_id': '3', 'answers': []},
+    {'set_id': True, 'answers': []},
+    {'set_id': 3, 'answers': 'A'},
+    {'set_id': 3, 'answers': [1]},
+    {'set_id': 3, 'answers': [{'question_id': '1', 'answer': 'A'}]},
+    {'set_id': 3, 'answers': [{'question_id': [1], 'answer': 'A'}]},
+])
+def test_malformed_submission_is_400(submit, body):
+    response = submit(body, answer_key(10))
+
+    assert response.status_code == 400
+    assert response.executed == []
+
+
+def test_requires_a_token(client):
+    response = client.post('/api/exams/submit', json={'set_id': 3, 'answers': []})
+
+    assert response.status_code == 401